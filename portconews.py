@@ -1,10 +1,13 @@
 import streamlit as st
 import feedparser
 import pandas as pd
-from datetime import datetime
 import ssl
 from PIL import Image
 import re
+import html
+import calendar
+import math
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure SSL context to handle certificate issues
 if hasattr(ssl, '_create_unverified_context'):
@@ -25,6 +28,10 @@ st.markdown(
     [data-testid="collapsedControl"] {
         display: none
     }
+    .article-date {
+        opacity: 0.6;
+        font-size: 0.875rem;
+    }
     </style>
     """,
     unsafe_allow_html=True,
@@ -44,70 +51,113 @@ except FileNotFoundError:
 st.title("Red Beard Ventures Portco News Feed 📰")
 st.write("Stay updated with the latest news from our portfolio companies.")
 
-# RSS feed URL
-RSS_FEED_URL = "https://zapier.com/engine/rss/21248761/feed"
+# RSS feed URLs
+RSS_FEED_URLS = (
+    "https://zapier.com/engine/rss/21248761/feed",
+)
+
+# Maximum number of feeds fetched concurrently
+MAX_FEED_WORKERS = 4
 
+# Number of articles shown per page
+PAGE_SIZE = 25
 
-# Parses an RSS feed and returns a list of articles
-def parse_rss_feed(url):
-    try:
-        # Parse with SSL verification disabled
-        feed = feedparser.parse(url)
+# Matches HTML tags in feed descriptions
+_TAG_RE = re.compile(r'<[^<]+?>')
+
+# Matches Zapier's "Title and URL:" label and everything from " - http" on
+_TITLE_URL_RE = re.compile(r'Title and URL:| - http.*', re.DOTALL)
+
+# Matches any line ending CommonMark recognises (\r\n, \r or \n)
+_LINE_BREAK_RE = re.compile(r'\r\n?|\n')
+
+# Columns of the articles DataFrame returned by parse_rss_feed
+ARTICLE_COLUMNS = ["title", "link", "date", "description"]
+
+
+# Strips HTML tags and Zapier's "Title and URL:" boilerplate from a description
+def _clean_description(description):
+    # Clean HTML tags from description
+    description = _TAG_RE.sub('', description)
+    # Remove "Title and URL:" prefixes and the trailing URL part if present
+    if "Title and URL:" in description:
+        description = _TITLE_URL_RE.sub('', description).strip()
+    return description
+
+
+# Builds the HTML block for a single article from its preformatted date.
+# No field may contain a raw line break, since a blank line would end the
+# HTML block early and the rest of the page would be parsed as markdown.
+def _article_html(title, link, date_str, description):
+    parts = [
+        f"<h3>{html.escape(' '.join(title.split()))}</h3>",
+        f"<p class='article-date'>📅 {date_str}</p>",
+    ]
+
+    # Include description if available, keeping its line breaks as <br>
+    if description and description != title:
+        text = _LINE_BREAK_RE.sub("<br>", html.escape(html.unescape(description)))
+        parts.append(f"<p>{text}</p>")
+
+    if link:
+        href = html.escape(''.join(link.split()))
+        parts.append(f"<p><a href='{href}' target='_blank'>Read Article</a></p>")
 
-        # Check for parse errors
-        if hasattr(feed, 'bozo_exception') and feed.bozo_exception:
-            st.error(f"Error parsing the RSS feed: {feed.bozo_exception}")
-            return []
+    return f"<div class='article'>{''.join(parts)}</div><hr>"
 
-        articles = []
-        seen_links = set()  # Track duplicate articles
 
-        for entry in feed.entries:
-            # Skip duplicates
-            link = entry.get('link', '')
-            if link in seen_links:
+# Parses RSS feeds and returns a DataFrame of articles, newest first
+@st.cache_data(ttl=600, show_spinner=False)
+def parse_rss_feed(urls):
+    try:
+        # Fetch feeds concurrently (SSL verification disabled); fetching is
+        # I/O-bound so threads overlap the network wait
+        with ThreadPoolExecutor(max_workers=MAX_FEED_WORKERS) as executor:
+            feeds = list(executor.map(feedparser.parse, urls))
+
+        entries = []
+
+        for url, feed in zip(urls, feeds):
+            # Check for parse errors
+            if hasattr(feed, 'bozo_exception') and feed.bozo_exception:
+                st.error(f"Error parsing the RSS feed {url}: {feed.bozo_exception}")
                 continue
-            seen_links.add(link)
-
-            # Extract publication date
-            if 'published' in entry:
-                try:
-                    pub_date = pd.to_datetime(entry.published)
-                except:
-                    pub_date = datetime.now()
-            elif 'updated' in entry:
-                try:
-                    pub_date = pd.to_datetime(entry.updated)
-                except:
-                    pub_date = datetime.now()
-            else:
-                pub_date = datetime.now()
-
-            # Extract description and clean it
-            description = entry.get('description', '') or entry.get('summary', '')
-            # Clean HTML tags from description
-            description = re.sub('<[^<]+?>', '', description)
-            # Remove "Title and URL:" prefixes if present
-            if "Title and URL:" in description:
-                description = description.replace("Title and URL:", "").strip()
-                # Remove the URL part if it appears at the end
-                if " - http" in description:
-                    description = description.split(" - http")[0].strip()
-
-            article = {
-                "title": entry.get('title', 'No Title'),
-                "link": link,
-                "date": pub_date,
-                "description": description,
-            }
-
-            articles.append(article)
-
-        return articles
+
+            entries.extend(feed.entries)
+
+        # feedparser already normalizes entry dates to UTC struct_time, so
+        # convert each distinct one to epoch seconds and build timestamps in
+        # a single vectorized call with no string format inference; missing
+        # or unparseable dates fall back to the current time
+        raw_dates = [e.get('published_parsed') or e.get('updated_parsed') for e in entries]
+        unique_dates = list(dict.fromkeys(raw_dates))
+        epochs = [calendar.timegm(d) if d else float('nan') for d in unique_dates]
+        parsed_dates = pd.to_datetime(epochs, unit='s', errors='coerce', utc=True)
+        parsed_dates = parsed_dates.fillna(pd.Timestamp.now(tz='UTC'))
+        date_cache = dict(zip(unique_dates, parsed_dates))
+        pub_dates = [date_cache[raw_date] for raw_date in raw_dates]
+
+        descriptions = [
+            _clean_description(e.get('description', '') or e.get('summary', ''))
+            for e in entries
+        ]
+
+        articles = pd.DataFrame({
+            "title": [e.get('title', 'No Title') for e in entries],
+            "link": [e.get('link', '') for e in entries],
+            "date": pub_dates,
+            "description": descriptions,
+        }, columns=ARTICLE_COLUMNS)
+
+        # Drop duplicate articles, keeping the first occurrence in feed order
+        articles = articles.drop_duplicates(subset="link", keep="first")
+
+        # Sort by date (newest first)
+        return articles.sort_values("date", ascending=False, kind="stable", ignore_index=True)
 
     except Exception as e:
         st.error(f"Error loading feed: {e}")
-        return []
+        return pd.DataFrame(columns=ARTICLE_COLUMNS)
 
 
 # Add a refresh button at the top
@@ -115,46 +165,36 @@ col1, col2, col3 = st.columns([6, 1, 1])
 with col3:
     refresh = st.button("🔄 Refresh")
 
-# Initialize session state for articles if not exists
-if 'articles' not in st.session_state or refresh:
-    with st.spinner("Loading news feed..."):
-        st.session_state.articles = parse_rss_feed(RSS_FEED_URL)
+# Drop cached feed data so it is fetched again
+if refresh:
+    parse_rss_feed.clear()
+
+with st.spinner("Loading news feed..."):
+    articles = parse_rss_feed(RSS_FEED_URLS)
 
 # Main content area - display articles
-if not st.session_state.articles:
+if articles.empty:
     st.warning("No articles found in the feed. Please check your connection and try refreshing.")
 else:
-    # Sort by date (newest first)
-    articles = sorted(
-        st.session_state.articles,
-        key=lambda x: x.get('date', datetime.now()),
-        reverse=True
+    # Page selector
+    page_count = math.ceil(len(articles) / PAGE_SIZE)
+    page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+    start = (page - 1) * PAGE_SIZE
+    end = min(start + PAGE_SIZE, len(articles))
+    page_articles = articles.iloc[start:end]
+
+    # Display the range shown on this page
+    st.subheader(f"📚 Showing {start + 1}–{end} of {len(articles)} News Articles")
+
+    # Format all dates on the page in one vectorized call
+    page_articles = page_articles.assign(date=page_articles["date"].dt.strftime('%B %d, %Y'))
+
+    # Display the current page of articles with a single markdown element
+    articles_html = "\n".join(
+        _article_html(title, link, date_str, description)
+        for title, link, date_str, description in page_articles.itertuples(index=False, name=None)
     )
-
-    # Display total count
-    st.subheader(f"📚 Showing {len(articles)} News Articles")
-
-    # Display each article
-    for article in articles:
-        with st.container():
-            cols = st.columns([3, 1])
-
-            with cols[0]:
-                st.subheader(article['title'])
-
-                # Display date if available
-                if 'date' in article:
-                    st.caption(f"📅 {article['date'].strftime('%B %d, %Y')}")
-
-                # Display description if available
-                if article.get('description') and article['description'] != article['title']:
-                    st.write(article['description'])
-
-            with cols[1]:
-                if article.get('link'):
-                    st.link_button("Read Article", article['link'], use_container_width=True)
-
-            st.divider()
+    st.markdown(articles_html, unsafe_allow_html=True)
 
     # Footer
     st.caption("Red Beard Ventures © 2025 | Data updates when you click Refresh.")